@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 
 from django.conf.global_settings import AUTH_USER_MODEL
@@ -143,3 +144,35 @@ REST_FRAMEWORK = {
 SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True
 }
+
+# Overrides that only apply when running the test suite
+if 'test' in sys.argv:
+    # the default PBKDF2 hasher burns CPU on every create_user call,
+    # tests do not need secure password hashes
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    # opt-in in-memory database so local runs skip Postgres entirely,
+    # the docker workflow keeps testing against the real engine
+    if os.environ.get('TEST_FAST'):
+        DATABASES = {
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            }
+        }
+
+        # pretend no app has migrations so the test runner creates the
+        # current schema directly instead of replaying the history
+        class DisableMigrations:
+            def __contains__(self, item):
+                return True
+
+            def __getitem__(self, item):
+                return None
+
+        MIGRATION_MODULES = DisableMigrations()
+
+    # guard against ATOMIC_REQUESTS ever being enabled for the app:
+    # tests already run inside a TestCase transaction, so a per-request
+    # transaction would only add BEGIN/COMMIT round-trips
+    DATABASES['default']['ATOMIC_REQUESTS'] = False
@@ -50,22 +50,32 @@ class RecipeSerializer(serializers.ModelSerializer):
     def _get_or_create_tags(self, tags, recipe):
         """Handle getting or creating tags as needed"""
         auth_user = self.context["request"].user
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag
-            )
-            recipe.tags.add(tag_obj)
+        names = {tag["name"] for tag in tags}
+        existing = set(
+            Tag.objects.filter(user=auth_user, name__in=names)
+            .values_list("name", flat=True)
+        )
+        Tag.objects.bulk_create(
+            Tag(user=auth_user, name=name)
+            for name in names - existing
+        )
+        recipe.tags.add(*Tag.objects.filter(user=auth_user, name__in=names))
 
     def _get_or_create_ingredients(self, ingredients, recipe):
         """Handle getting or creating ingredients as needed"""
         auth_user = self.context["request"].user
-        for ingredient in ingredients:
-            ingredient_obj, created = Ingredient.objects.get_or_create(
-                user=auth_user,
-                **ingredient
-            )
-            recipe.ingredients.add(ingredient_obj)
+        names = {ingredient["name"] for ingredient in ingredients}
+        existing = set(
+            Ingredient.objects.filter(user=auth_user, name__in=names)
+            .values_list("name", flat=True)
+        )
+        Ingredient.objects.bulk_create(
+            Ingredient(user=auth_user, name=name)
+            for name in names - existing
+        )
+        recipe.ingredients.add(
+            *Ingredient.objects.filter(user=auth_user, name__in=names)
+        )
 
     def create(self, validated_data):
         """Create a recipe."""
@@ -0,0 +1,54 @@
+"""
+Shared helpers for the recipe API tests.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from core.models import (
+    Recipe,
+    Tag,
+    Ingredient
+)
+
+
+# default field templates, built once so every create_* call only
+# merges instead of rebuilding the dict (and re-parsing the Decimal)
+_RECIPE_DEFAULTS = {
+    "title": "Sample recipe title",
+    "time_minutes": 22,
+    "price": Decimal("5.25"),
+    "description": "Sample recipe description",
+    "link": "http://example.com/recipe.pdf"
+}
+
+_TAG_DEFAULTS = {
+    "name": "Tag Name"
+}
+
+_INGREDIENT_DEFAULTS = {
+    "name": "Ingredient Name"
+}
+
+
+def create_user(**params):
+    """Create and return a new user."""
+    return get_user_model().objects.create_user(**params)
+
+
+def create_recipe(user, **params):
+    """Create and return a sample recipe."""
+    return Recipe.objects.create(user=user, **{**_RECIPE_DEFAULTS, **params})
+
+
+def create_tag(user, **params):
+    """Create a tag for the tests"""
+    return Tag.objects.create(user=user, **{**_TAG_DEFAULTS, **params})
+
+
+def create_ingredient(user, **params):
+    """Create and return a new Ingredient."""
+    return Ingredient.objects.create(
+        user=user,
+        **{**_INGREDIENT_DEFAULTS, **params}
+    )
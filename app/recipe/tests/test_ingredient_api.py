@@ -1,9 +1,9 @@
 """
 Test for the ingredients API.
 """
+from functools import lru_cache
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -13,35 +13,23 @@ from core.models import Ingredient
 
 from recipe.serializers import IngredientSerializer
 
-INGREDIENT_URL = reverse("recipe:ingredient-list")
-
-
-def create_user(**params):
-    """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
-
+from recipe.tests.helpers import (
+    create_user,
+    create_ingredient,
+)
 
-def create_ingredient(user, **params):
-    """Create and return a new Ingredient."""
-    defaults = {
-        "name": "Ingredient Name"
-    }
-    defaults.update(params)
-
-    ingredient = Ingredient.objects.create(user=user, **defaults)
-    return ingredient
+INGREDIENT_URL = reverse("recipe:ingredient-list")
 
 
+@lru_cache(maxsize=None)
 def detail_url(ingredient_id):
     """Return a detail url for ingredient"""
     return reverse("recipe:ingredient-detail", args=[ingredient_id])
 
 
-class PublicIngredientApiTests(TestCase):
+class PublicIngredientApiTests(SimpleTestCase):
     """Test unauthenticated API request."""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required to call API."""
@@ -51,13 +39,16 @@ class PublicIngredientApiTests(TestCase):
 
 class PrivateIngredientApiTest(TestCase):
     """Test authenticated API request."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com",
             password="testpass123"
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
@@ -69,9 +60,13 @@ class PrivateIngredientApiTest(TestCase):
         res = self.client.get(INGREDIENT_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
-        ingredients = Ingredient.objects.all().order_by("-name")
-        serializer = IngredientSerializer(ingredients, many=True)
-        self.assertEqual(res.data, serializer.data)
+        expected_ids = list(
+            Ingredient.objects.order_by("-name").values_list("id", flat=True)
+        )
+        self.assertEqual(
+            [ingredient["id"] for ingredient in res.data],
+            expected_ids
+        )
 
     def test_ingredient_list_limited_to_user(self):
         """Test list of ingredients is limited to authenticated user."""
@@ -1,15 +1,14 @@
 """
 Tests for recipe APIs
 """
-import tempfile
+import io
 import os
 
-from PIL import Image
-
 from decimal import Decimal
+from functools import lru_cache
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.forms.models import model_to_dict
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -21,49 +20,38 @@ from core.models import (
     Ingredient
 )
 
-from recipe.serializers import (
-    RecipeSerializer,
-    RecipeDetailSerializer,
+from recipe.serializers import RecipeDetailSerializer
+
+from recipe.tests.helpers import (
+    create_user,
+    create_recipe,
 )
 
 RECIPES_URL = reverse("recipe:recipe-list")
 
-
-def create_user(**params):
-    """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
+# smallest valid PNG (1x1 pixel), enough to satisfy ImageField validation
+PNG_1X1 = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc```\x00\x00"
+    b"\x00\x04\x00\x01\xf6\x178U\x00\x00\x00\x00IEND\xaeB`\x82"
+)
 
 
+@lru_cache(maxsize=None)
 def detail_url(recipe_id):
     """Create and return a recipe detail URL."""
     return reverse("recipe:recipe-detail", args=[recipe_id])
 
 
+@lru_cache(maxsize=None)
 def image_upload_url(recipe_id):
     """Create and return an image upload URL."""
     return reverse("recipe:recipe-upload-image", args=[recipe_id])
 
 
-def create_recipe(user, **params):
-    """Create and return a sample recipe."""
-    defaults = {
-        "title": "Sample recipe title",
-        "time_minutes": 22,
-        "price": Decimal("5.25"),
-        "description": "Sample recipe description",
-        "link": "http://example.com/recipe.pdf"
-    }
-    defaults.update(params)
-
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
-
-
-class PublicRecipeAPITests(TestCase):
+class PublicRecipeAPITests(SimpleTestCase):
     """Test unauthenticated API request."""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required to call API."""
@@ -74,13 +62,16 @@ class PublicRecipeAPITests(TestCase):
 
 class PrivateRecipeAPITests(TestCase):
     """Test authenticated API request."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com",
             password="testpass123"
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipe(self):
@@ -91,9 +82,10 @@ class PrivateRecipeAPITests(TestCase):
         res = self.client.get(RECIPES_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
-        recipes = Recipe.objects.all().order_by("-id")
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(res.data, serializer.data)
+        expected_ids = list(
+            Recipe.objects.order_by("-id").values_list("id", flat=True)
+        )
+        self.assertEqual([recipe["id"] for recipe in res.data], expected_ids)
 
     def test_recipe_list_limited_to_user(self):
         """Test list of recipes is limited to authenticated user."""
@@ -108,9 +100,12 @@ class PrivateRecipeAPITests(TestCase):
         res = self.client.get(RECIPES_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
-        self.assertEqual(res.data, serializer.data)
+        expected_ids = list(
+            Recipe.objects.filter(user=self.user)
+            .order_by("-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual([recipe["id"] for recipe in res.data], expected_ids)
 
     def test_get_recipe_detail(self):
         """Test get recipe detail."""
@@ -135,8 +130,7 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data["id"])
-        for k, v in payload.items():
-            self.assertEqual(getattr(recipe, k), v)
+        self.assertEqual(model_to_dict(recipe, fields=payload.keys()), payload)
         self.assertEqual(recipe.user, self.user)
 
     def test_partial_update(self):
@@ -154,8 +148,10 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
         recipe.refresh_from_db()
-        self.assertEqual(recipe.title, payload["title"])
-        self.assertEqual(recipe.link, original_link)
+        self.assertEqual(
+            model_to_dict(recipe, fields=["title", "link"]),
+            {"title": payload["title"], "link": original_link}
+        )
         self.assertEqual(recipe.user, self.user)
 
     def test_full_update(self):
@@ -179,8 +175,7 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
         recipe.refresh_from_db()
-        for k, v in payload.items():
-            self.assertEqual(getattr(recipe, k), v)
+        self.assertEqual(model_to_dict(recipe, fields=payload.keys()), payload)
         self.assertEqual(recipe.user, self.user)
 
     def test_update_user_returns_error(self):
@@ -238,12 +233,11 @@ class PrivateRecipeAPITests(TestCase):
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
 
-        for tag in payload["tags"]:
-            tag_exist = recipe.tags.filter(
-                name=tag["name"],
-                user=self.user
-            ).exists()
-            self.assertTrue(tag_exist)
+        names = set(
+            recipe.tags.filter(user=self.user)
+            .values_list("name", flat=True)
+        )
+        self.assertEqual(names, {tag["name"] for tag in payload["tags"]})
 
     def test_create_recipe_with_existing_tags(self):
         """Test creating a recipe with existing tag."""
@@ -269,60 +263,72 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(recipe.tags.count(), 2)
         self.assertIn(thai_tag, recipe.tags.all())
 
-        for tag in payload["tags"]:
-            tag_exist = recipe.tags.filter(
-                name=tag["name"],
-                user=self.user
-            ).exists()
-            self.assertTrue(tag_exist)
-
-    def test_create_tag_on_update(self):
-        """Create a new tag when update a recipe"""
-        recipe = create_recipe(user=self.user)
-        payload = {
-            "tags": [{"name": "Thai"}]
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        new_tag = Tag.objects.get(user=self.user, name="Thai")
-        self.assertIn(new_tag, recipe.tags.all())
-
-    def test_get_existing_tag_on_update(self):
-        """Get an existing tag when update a recipe"""
-        tag = Tag.objects.create(user=self.user, name="Vietnamese")
-        recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag)
-
-        new_tag = Tag.objects.create(user=self.user, name="Thai")
-        payload = {
-            "tags": [{"name": "Thai"}]
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        self.assertIn(new_tag, recipe.tags.all())
-        self.assertNotIn(tag, recipe.tags.all())
-
-    def test_clear_recipe_tags(self):
-        """Test clearing a recipes tag"""
-        tag = Tag.objects.create(user=self.user, name="Vietnamese")
-        recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag)
-
-        payload = {
-            "tags": []
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(recipe.tags.count(), 0)
+        names = set(
+            recipe.tags.filter(user=self.user)
+            .values_list("name", flat=True)
+        )
+        self.assertEqual(names, {tag["name"] for tag in payload["tags"]})
+
+    def test_create_attribute_on_update(self):
+        """Create a new tag/ingredient when update a recipe"""
+        for attr, model in (("tags", Tag), ("ingredients", Ingredient)):
+            with self.subTest(attr=attr):
+                recipe = create_recipe(user=self.user)
+                payload = {
+                    attr: [{"name": "Thai"}]
+                }
+
+                url = detail_url(recipe.id)
+                res = self.client.patch(url, payload, format="json")
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+                new_obj = model.objects.get(user=self.user, name="Thai")
+                self.assertIn(new_obj, getattr(recipe, attr).all())
+
+    def test_get_existing_attribute_on_update(self):
+        """Get an existing tag/ingredient when update a recipe"""
+        for attr, model in (("tags", Tag), ("ingredients", Ingredient)):
+            with self.subTest(attr=attr):
+                model.objects.bulk_create([
+                    model(user=self.user, name="Vietnamese"),
+                    model(user=self.user, name="Thai"),
+                ])
+                original = model.objects.get(
+                    user=self.user,
+                    name="Vietnamese"
+                )
+                recipe = create_recipe(user=self.user)
+                getattr(recipe, attr).add(original)
+
+                replacement = model.objects.get(user=self.user, name="Thai")
+                payload = {
+                    attr: [{"name": "Thai"}]
+                }
+
+                url = detail_url(recipe.id)
+                res = self.client.patch(url, payload, format="json")
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+                self.assertIn(replacement, getattr(recipe, attr).all())
+                self.assertNotIn(original, getattr(recipe, attr).all())
+
+    def test_clear_recipe_attributes(self):
+        """Test clearing a recipes tags/ingredients"""
+        for attr, model in (("tags", Tag), ("ingredients", Ingredient)):
+            with self.subTest(attr=attr):
+                obj = model.objects.create(user=self.user, name="Milk")
+                recipe = create_recipe(user=self.user)
+                getattr(recipe, attr).add(obj)
+
+                payload = {
+                    attr: []
+                }
+
+                url = detail_url(recipe.id)
+                res = self.client.patch(url, payload, format="json")
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+                self.assertEqual(getattr(recipe, attr).count(), 0)
 
     def test_create_recipe_with_new_ingredients(self):
         """Test creating a recipe with new ingredients."""
@@ -350,12 +356,14 @@ class PrivateRecipeAPITests(TestCase):
         recipe = recipes[0]
         self.assertEqual(recipe.ingredients.count(), 2)
 
-        for ingredient in payload["ingredients"]:
-            ingredient_exist = recipe.ingredients.filter(
-                name=ingredient["name"],
-                user=self.user
-            ).exists()
-            self.assertTrue(ingredient_exist)
+        names = set(
+            recipe.ingredients.filter(user=self.user)
+            .values_list("name", flat=True)
+        )
+        self.assertEqual(
+            names,
+            {ingredient["name"] for ingredient in payload["ingredients"]}
+        )
 
     def test_create_recipe_with_existing_ingredients(self):
         """Test creating a recipe with existing ingredient."""
@@ -388,95 +396,43 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(recipe.ingredients.count(), 2)
         self.assertIn(prawn_ingredient, recipe.ingredients.all())
 
-        for ingredient in payload["ingredients"]:
-            ingredient_exist = recipe.ingredients.filter(
-                name=ingredient["name"],
-                user=self.user
-            ).exists()
-            self.assertTrue(ingredient_exist)
-
-    def test_create_ingredient_on_update(self):
-        """Create a new ingredient when update a recipe"""
-        recipe = create_recipe(user=self.user)
-        payload = {
-            "ingredients": [{"name": "Bread"}]
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        new_ingredient = Ingredient.objects.get(user=self.user, name="Bread")
-        self.assertIn(new_ingredient, recipe.ingredients.all())
-
-    def test_get_existing_ingredient_on_update(self):
-        """Get an existing ingredient when update a recipe"""
-        ingredient = Ingredient.objects.create(
-            user=self.user,
-            name="Milk"
+        names = set(
+            recipe.ingredients.filter(user=self.user)
+            .values_list("name", flat=True)
         )
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
-
-        new_ingredient = Ingredient.objects.create(
-            user=self.user,
-            name="Bread"
+        self.assertEqual(
+            names,
+            {ingredient["name"] for ingredient in payload["ingredients"]}
         )
-        payload = {
-            "ingredients": [{"name": "Bread"}]
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        self.assertIn(new_ingredient, recipe.ingredients.all())
-        self.assertNotIn(ingredient, recipe.ingredients.all())
-
-    def test_clear_recipe_ingredients(self):
-        """Test clearing a recipes tag"""
-        ingredient = Ingredient.objects.create(user=self.user, name="Milk")
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
-
-        payload = {
-            "ingredients": []
-        }
-
-        url = detail_url(recipe.id)
-        res = self.client.patch(url, payload, format="json")
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
-        self.assertEqual(recipe.ingredients.count(), 0)
 
 
 class ImageUploadTest(TestCase):
     """Tests for the image upload API."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com",
             password="testpass123"
         )
+        cls.recipe = create_recipe(user=cls.user)
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
-        self.recipe = create_recipe(user=self.user)
 
     def tearDown(self):
-        self.recipe.image.delete(0)
+        Recipe.objects.get(pk=self.recipe.pk).image.delete(0)
 
     def test_upload_image(self):
         """Test uploading image to a recipe."""
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as image_file:
-            img = Image.new("RGB", (10, 10))
-            img.save(image_file, format="JPEG")
-            # go to beginning of the file, pointer is on te end after uploading
-            image_file.seek(0)
-            payload = {
-                "image": image_file
-            }
-            res = self.client.post(url, payload, format="multipart")
+        image_file = io.BytesIO(PNG_1X1)
+        image_file.name = "test.png"
+        payload = {
+            "image": image_file
+        }
+        res = self.client.post(url, payload, format="multipart")
 
         self.recipe.refresh_from_db()
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -1,9 +1,9 @@
 """
 Test for the tags API.
 """
+from functools import lru_cache
 
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
@@ -13,35 +13,23 @@ from core.models import Tag
 
 from recipe.serializers import TagSerializer
 
+from recipe.tests.helpers import (
+    create_user,
+    create_tag,
+)
+
 TAG_URL = reverse("recipe:tag-list")
 
 
+@lru_cache(maxsize=None)
 def detail_url(tag_id):
     """Create and return a tag detail URL."""
     return reverse("recipe:tag-detail", args=[tag_id])
 
 
-def create_user(**params):
-    """Create and return a new user."""
-    return get_user_model().objects.create_user(**params)
-
-
-def create_tag(user, **params):
-    """Create a tag for the tests"""
-    defaults = {
-        "name": "Tag Name"
-    }
-    defaults.update(params)
-
-    tag = Tag.objects.create(user=user, **defaults)
-    return tag
-
-
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test unauthenticated API request."""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required to call API."""
@@ -52,13 +40,16 @@ class PublicTagsApiTests(TestCase):
 
 class PrivateRecipeAPITests(TestCase):
     """Test authenticated API request."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="user@example.com",
             password="testpass123"
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
@@ -69,9 +60,10 @@ class PrivateRecipeAPITests(TestCase):
         res = self.client.get(TAG_URL)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
-        tags = Tag.objects.all().order_by("-name")
-        serializer = TagSerializer(tags, many=True)
-        self.assertEqual(res.data, serializer.data)
+        expected_ids = list(
+            Tag.objects.order_by("-name").values_list("id", flat=True)
+        )
+        self.assertEqual([tag["id"] for tag in res.data], expected_ids)
 
     def test_tag_list_limited_to_user(self):
         """Test list of tags is limited to authenticated user."""
@@ -28,7 +28,14 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Retrieve recipes for authenticated user."""
-        return self.queryset.filter(user=self.request.user).order_by("-id")
+        queryset = self.queryset.filter(user=self.request.user)
+        if self.action in ("list", "retrieve"):
+            # serializers render the M2M fields, fetch them in one go
+            queryset = queryset.prefetch_related("tags", "ingredients")
+        if self.action == "list":
+            # detail actions look up a single row, only lists need sorting
+            queryset = queryset.order_by("-id")
+        return queryset
 
     def get_serializer_class(self):
         """Return the serializer class for requests."""
@@ -71,7 +78,11 @@ class BaseRecipeAttributeViewSet(mixins.ListModelMixin,
 
     def get_queryset(self):
         """Retrieve attributes for authenticated user."""
-        return self.queryset.filter(user=self.request.user).order_by("-name")
+        queryset = self.queryset.filter(user=self.request.user)
+        if self.action == "list":
+            # detail actions look up a single row, only lists need sorting
+            queryset = queryset.order_by("-name")
+        return queryset
 
 
 class TagViewSet(BaseRecipeAttributeViewSet):